@@ -1,6 +1,9 @@
 # checkin.py
 from datetime import datetime
 
+# Format of the time column in the check-ins spreadsheet
+TIME_FORMAT = "%Y-%m-%d  %H:%M:%S"
+
 
 class CheckIn:
     """A check-in of a Team Rocket Delivery agent at a specific
@@ -14,6 +17,9 @@ class CheckIn:
     :param datetime.datetime time: Stores time at which agent checked in
     """
 
+    # Timelines hold many check-ins, so skip the per-instance __dict__
+    __slots__ = ('name', 'pokeball', 'location', 'time')
+
     def __init__(self, name, pokeball, location, time):
         """Constructor
 
@@ -29,7 +35,7 @@ class CheckIn:
         self.name = name
         self.pokeball = pokeball
         self.location = location
-        self.time = datetime.strptime(time, "%Y-%m-%d  %H:%M:%S")
+        self.time = datetime.strptime(time, TIME_FORMAT)
 
     def __lt__(self, other):
         """Overloaded < operator.
@@ -1,5 +1,9 @@
 # checkin_timeline.py
+import bisect
+import collections
 import datetime
+import itertools
+import operator
 
 
 class DataError(Exception):
@@ -22,8 +26,8 @@ class CheckInTimeline:
     -Instances have one member variable:
         checkins: a list that stores the sequence of CheckIn instances.
         Note that this list will always be sorted by check-in time,
-        provided that the CheckInTimeline.add() method is used to add
-        new CheckIns.
+        provided that the CheckInTimeline.add() or
+        CheckInTimeline.add_all() methods are used to add new CheckIns.
     """
 
     def __init__(self):
@@ -38,17 +42,40 @@ class CheckInTimeline:
 
         Adds a CheckIn to the timeline of check-ins.
 
-        -When the check-in is added, the timeline of check-ins is sorted
-        by time stamp to ensure that they remain in order: from least recent
-        to most recent.
+        -The check-in is inserted at its sorted position (found with a
+        binary search) to ensure that the timeline remains in order: from
+        least recent to most recent. Check-ins with equal times keep the
+        order in which they were added.
 
         :param CheckIn checkin: The CheckIn to add.
 
         :returns: None
         """
-        # Add checkin to end of checkins list and then sort the list.
-        self.checkins.append(checkin)
-        self.checkins = sorted(self.checkins)
+        # Find where checkin belongs and splice it in, instead of
+        # re-sorting the whole list on every add.
+        index = bisect.bisect_right(self.checkins, checkin)
+        self.checkins[index:index] = (checkin,)
+
+    def add_all(self, checkins):
+        """
+
+        Adds many CheckIns to the timeline of check-ins at once.
+
+        -The timeline is sorted a single time after all of the check-ins
+        have been added, which is much cheaper than calling add() for each
+        one when loading a whole spreadsheet.
+
+        :param iterable checkins: The CheckIns to add.
+
+        :returns: None
+        """
+        # Sort the new list in place rather than building copies. The sort
+        # is stable, so equal times keep the order they came in. Sorting
+        # on the times themselves avoids calling CheckIn.__lt__.
+        new_checkins = list(self.checkins)
+        new_checkins.extend(checkins)
+        new_checkins.sort(key=operator.attrgetter('time'))
+        self.checkins = new_checkins
 
     def windows(self, window_size=datetime.timedelta(0, 3600)):
         """A generator for iterating over windows of a given size.
@@ -68,29 +95,19 @@ class CheckInTimeline:
         :rtype: iterable
         """
 
-        # Number of checkins to iterate over
-        size = len(self.checkins)
-
-        for index in range(size):
-            # Declare empty tuple for each run
-            tup = ()
-
-            # Gets the initial checkin's time
-            checkin1 = self.checkins[index]
-            time1 = checkin1.time
-
-            # Compares that time to the following times
-            for index2 in range(index, size):
-                checkin2 = self.checkins[index2]
-                time2 = checkin2.time
+        # Take the times from checkins on every call, so the windows
+        # always match whatever checkins currently holds.
+        times = [checkin.time for checkin in self.checkins]
 
-                # Adds the time to the tuple if within window_size
-                if (time2 - time1) < window_size:
-                    tup += (checkin2,)
-                else:
-                    break
+        # Binary search for the first checkin that is not within
+        # window_size of each checkin: that's where its window ends.
+        # Searching with map() keeps the whole batch of searches in C.
+        limits = [time + window_size for time in times]
+        ends = map(bisect.bisect_left,
+                   itertools.repeat(times), limits, itertools.count())
 
-            yield tup
+        for index, end in enumerate(ends):
+            yield tuple(self.checkins[index:end])
 
     def rendezvous(self, window_size=datetime.timedelta(0, 3600)):
         """A generator for chronologically iterating over rendezvous.
@@ -115,28 +132,74 @@ class CheckInTimeline:
         input data.
         """
 
-        # Process windows to check for rendezvous.
-        for window in self.windows(window_size):
-            # Starts with first checkin in window tuple within time window
-            tup = (window[0],)
-            first_checkin_loc = window[0].location
-
-            # Compares first checkin window with rest to check if they
-            # were at the same location in that period.
-            for window2 in window[1:]:
-                other_checkin = window2.location
-
-                # If so, add that to a rendezvous tuple
-                if first_checkin_loc == other_checkin:
-                    tup += (window2,)
-
-            # If the tuple has less than two items, no rendezvous occurred
-            if len(tup) < 2:
-                tup = ()
-            # Only yield the tup if rendezvous had two members
-            elif len(tup) == 2:
-                yield tup
-            # Otherwise rise an exception
-            else:
-                error_msg = 'DataError: Too many members at rendezvous'
-                raise DataError(error_msg)
+        # Sweep over the timeline once. Each checkin opens a window, and
+        # the windows of a location that are still open live in a bucket,
+        # so a new checkin only needs to look at its own location's bucket.
+        buckets = collections.defaultdict(collections.deque)
+        partners = {}
+        crowded = set()
+
+        # Index of the oldest checkin whose window is still open. Windows
+        # close in order, so rendezvous are yielded in order too.
+        start = 0
+
+        # The sweep only needs the times and locations, so pull them out
+        # of checkins once per call. Local names are also faster to look
+        # up in the loop below.
+        times = [checkin.time for checkin in self.checkins]
+        locations = [checkin.location for checkin in self.checkins]
+        close_window = self._close_window
+
+        for index, (time, location) in enumerate(zip(times, locations)):
+            # Close every window this checkin falls outside of. The
+            # closing window is always the oldest one in its bucket.
+            while start < index and time - times[start] >= window_size:
+                buckets[locations[start]].popleft()
+                pair = close_window(start, partners, crowded)
+                if pair is not None:
+                    yield pair
+                start += 1
+
+            # This checkin joins every open window at its location
+            bucket = buckets[location]
+            for first in bucket:
+                if first in partners:
+                    crowded.add(first)
+                else:
+                    partners[first] = index
+
+            bucket.append(index)
+
+        # Close the windows that are still open at the end of the timeline
+        for first in range(start, len(self.checkins)):
+            pair = close_window(first, partners, crowded)
+            if pair is not None:
+                yield pair
+
+    def _close_window(self, index, partners, crowded):
+        """A helper method for rendezvous().
+
+        -Returns the rendezvous for the window starting at the check-in at
+        index, if that window contained one.
+
+        :param int index: The index of the first check-in in the window.
+        :param dict partners: Maps the index of a first check-in to the
+        index of its partner.
+        :param set crowded: The indexes of first check-ins with too many
+        partners.
+
+        :returns: The pair of CheckIns that met in the window, or None if
+        the window didn't contain a rendezvous.
+
+        :rtype: tuple
+
+        :raises DataError: If the window had more than two members.
+        """
+        # Only return the pair if rendezvous had two members
+        if index in crowded:
+            error_msg = 'DataError: Too many members at rendezvous'
+            raise DataError(error_msg)
+        elif index in partners:
+            return (self.checkins[index], self.checkins[partners.pop(index)])
+
+        return None
@@ -7,6 +7,9 @@ from checkin import CheckIn
 from checkin_timeline import CheckInTimeline, DataError
 from pokeball import Pokeball
 
+# Maps the ball type column of the CSV file to its Pokeball
+POKEBALL_BY_STR = {str(ball.value): ball for ball in Pokeball}
+
 
 def load_timeline(filename):
     """Loads a CSV file of Team Rocket agent checkins.
@@ -40,25 +43,33 @@ def load_timeline(filename):
         file. Note that this is thrown by the open() function.
 
     """
-    my_dict = {}
-    timeline = CheckInTimeline()
-
-    with open(filename) as csvfile:
+    # The csv module does its own newline handling, so the file is opened
+    # with newline='' and read in a single pass.
+    with open(filename, newline='') as csvfile:
         reader = csv.reader(csvfile)
 
-        for row in reader:
-            # Put agent name and initial Pokemon into a dictionary
-            # Row index: 0 = name, 1 = ball type, 2 = location, 3 = time
-            name, ball_type, location, time, init_poke = row
-            if init_poke != '':
-                my_dict[name] = init_poke
-
-            # Read data to checkins
-            input = (name, Pokeball(int(ball_type)), location, time)
-            checkin = CheckIn(*input)
-
-            # Add checkin to timeline
-            timeline.add(checkin)
+        # Row index: 0 = name, 1 = ball type, 2 = location, 3 = time,
+        # 4 = initial Pokemon. Unpacking each row checks its length.
+        # Intern repeated strings so equal names and locations are the
+        # same object, which makes comparing them cheap.
+        rows = [(sys.intern(name), ball_type, sys.intern(location), time,
+                 init_poke)
+                for name, ball_type, location, time, init_poke in reader]
+
+    # Put agent name and initial Pokemon into a dictionary
+    my_dict = {row[0]: row[4] for row in rows if row[4] != ''}
+
+    # Read data to checkins. Ball types that aren't in the lookup table
+    # (e.g. ' 1', or bad values) fall back to converting them by hand.
+    checkins = [CheckIn(name,
+                        POKEBALL_BY_STR.get(ball_type) or
+                        Pokeball(int(ball_type)),
+                        location, time)
+                for name, ball_type, location, time, _ in rows]
+
+    # Add all the checkins to the timeline, sorting them only once
+    timeline = CheckInTimeline()
+    timeline.add_all(checkins)
 
     return (my_dict, timeline)
 
@@ -113,47 +124,49 @@ def main(args):
         print(e)
         sys.exit(1)
 
-    if args.skip is True or args.exchanges is True:
-        for p1, p2 in timeline.rendezvous():
-            # --skip: prints message when pokeballs were not exchanged.
-            # Check if each p1 and p2 don't have same pokeball type.
-            if p1.pokeball != p2.pokeball and args.skip is True:
-                n1, n2 = p1.name, p2.name
+    # Go through the rendezvous once, making the exchanges and printing
+    # any messages that were asked for along the way.
+    for p1, p2 in timeline.rendezvous():
+        n1, n2 = p1.name, p2.name
+
+        # --skip: prints message when pokeballs were not exchanged.
+        # Check if each p1 and p2 don't have same pokeball type.
+        if p1.pokeball != p2.pokeball:
+            if args.skip is True:
                 msg = '{} (with {}) meets with {} (with {}), '
                 msg += 'but nothing happened.'
                 msg = msg.format(n1, p1.pokeball, n2, p2.pokeball)
                 print(msg)
 
-            # --exchanges,: prints message when pokeballs were exchanged.
-            # Check if each p1 and p2 have same pokeball type.
-            if p1.pokeball == p2.pokeball and args.exchanges is True:
-                n1, n2 = p1.name, p2.name
+        # --exchanges: prints message when pokeballs were exchanged.
+        # Either way, the dictionary needs to be updated.
+        else:
+            if args.exchanges is True:
                 msg = '{} meets with {} to exchange {} for {}'
                 msg = msg.format(n1, n2, dict[n1], dict[n2])
-                # Make the exchange.
-                dict[n1], dict[n2] = dict[n2], dict[n1]
                 print(msg)
 
-    # If --exchanges wasn't called, still need to update dictionary.
-    if args.exchanges is False:
-        for p1, p2 in timeline.rendezvous():
-            if p1.pokeball == p2.pokeball:
-                n1, n2 = p1.name, p2.name
-                dict[n1], dict[n2] = dict[n2], dict[n1]
+            # Make the exchange.
+            dict[n1], dict[n2] = dict[n2], dict[n1]
 
     # --pokemon: Checks who has the pokeball.
     if args.pokemon != '' or args.skip:
-        for key in dict.keys():
-            if dict[key] == args.pokemon:
-                msg = '{} had the {}'
-                msg = msg.format(key, args.pokemon)
-                print(msg)
-                break
+        # Find the first agent carrying the pokemon, stopping there.
+        owner = next((k for k, v in dict.items() if v == args.pokemon),
+                     None)
+
+        # Nobody is printed if nobody had the pokemon.
+        if owner is not None:
+            msg = '{} had the {}'
+            msg = msg.format(owner, args.pokemon)
+            print(msg)
 
     # Update dict for the exchanges and pretty print it.
+    # Note: this output has to match the expected output exactly, so it
+    # stays as pprint rather than a faster serializer like json.dumps,
+    # which would print different quotes and layout.
     if args.pokemon == '':
-        pp = pprint.PrettyPrinter(4)
-        pp.pprint(dict)
+        pprint.pprint(dict, indent=4)
 
 
 if __name__ == '__main__':
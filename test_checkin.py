@@ -77,3 +77,10 @@ def test_str():
     """Test str construction"""
     o = CheckIn("Tom", Pokeball.poke_ball, "Pokemart", "2016-09-10 12:04:02")
     assert str(o) == "Tom at Pokemart with a Poke Ball (2016-09-10 12:04:02)"
+
+
+def test_slots():
+    """Test that CheckIns only have the expected attributes"""
+    o = CheckIn("Tom", Pokeball.poke_ball, "Pokemart", "2016-09-10 12:04:02")
+    with pytest.raises(AttributeError):
+        o.nickname = "Tommy"
@@ -3,12 +3,13 @@
 Feel free to add more tests as you see fit.
 
 """
+import pytest
 import random
 
 from datetime import datetime, timedelta
 
 from checkin import CheckIn
-from checkin_timeline import CheckInTimeline
+from checkin_timeline import CheckInTimeline, DataError
 from pokeball import Pokeball
 
 
@@ -124,3 +125,87 @@ def test_rendezvous():
 
     # We only looped one time, so 'i' was set to zero, and that's it.
     assert i == 0
+
+
+def test_add_equal_times():
+    """Test that CheckIns with equal times stay in the order added."""
+    timeline = CheckInTimeline()
+    timeline.add(CheckIn("Bob", Pokeball.poke_ball, "Mart",
+                         "1970-01-02 02:00:00"))
+    timeline.add(CheckIn("Alice", Pokeball.poke_ball, "Mart",
+                         "1970-01-02 01:00:00"))
+    timeline.add(CheckIn("Carol", Pokeball.poke_ball, "Gym",
+                         "1970-01-02 01:00:00"))
+
+    names = [checkin.name for checkin in timeline.checkins]
+    assert names == ["Alice", "Carol", "Bob"]
+
+
+def test_add_all():
+    """Test that adding many CheckIns at once keeps them in order."""
+    timeline = CheckInTimeline()
+    timeline.add_all(random_timed_checkins(50))
+    timeline.add_all(random_timed_checkins(50))
+    assert len(timeline.checkins) == 100
+
+    for prev, current in zip(timeline.checkins, timeline.checkins[1:]):
+        assert prev.time <= current.time
+
+
+def test_rendezvous_order():
+    """Test that rendezvous are yielded in order of the first check-in"""
+    timeline = CheckInTimeline()
+    timeline.add_all([
+        CheckIn("Alice", Pokeball.poke_ball, "Mart", "1970-01-02 01:00:00"),
+        CheckIn("Carol", Pokeball.poke_ball, "Gym", "1970-01-02 01:10:00"),
+        CheckIn("Dave", Pokeball.poke_ball, "Gym", "1970-01-02 01:20:00"),
+        CheckIn("Bob", Pokeball.poke_ball, "Mart", "1970-01-02 01:30:00"),
+        CheckIn("Eve", Pokeball.poke_ball, "Mart", "1970-01-02 02:40:00"),
+    ])
+
+    names = [(a1.name, a2.name) for a1, a2 in timeline.rendezvous()]
+    assert names == [("Alice", "Bob"), ("Carol", "Dave")]
+
+
+def test_rendezvous_too_many():
+    """Test that a rendezvous with more than two members is an error"""
+    timeline = CheckInTimeline()
+    timeline.add_all([
+        CheckIn("Alice", Pokeball.poke_ball, "Mart", "1970-01-02 01:00:00"),
+        CheckIn("Bob", Pokeball.poke_ball, "Mart", "1970-01-02 01:10:00"),
+        CheckIn("Carol", Pokeball.poke_ball, "Mart", "1970-01-02 01:20:00"),
+    ])
+
+    with pytest.raises(DataError):
+        list(timeline.rendezvous())
+
+
+def test_window_assigned_checkins():
+    """Test that windows() follows checkins when it's assigned directly."""
+    timeline = CheckInTimeline()
+    timeline.checkins = sorted(random_timed_checkins(20))
+
+    windows = list(timeline.windows())
+    assert len(windows) == 20
+    for checkin, window in zip(timeline.checkins, windows):
+        assert window[0] is checkin
+
+    # Appending keeps the list sorted here, and windows() should see it
+    last = timeline.checkins[-1]
+    timeline.checkins.append(CheckIn("Bob",
+                                     Pokeball.poke_ball,
+                                     "Pokemart",
+                                     str(last.time + timedelta(minutes=1))))
+    assert len(list(timeline.windows())) == 21
+
+
+def test_rendezvous_assigned_checkins():
+    """Test that rendezvous() follows checkins when it's assigned directly."""
+    timeline = CheckInTimeline()
+    timeline.checkins = [
+        CheckIn("Alice", Pokeball.poke_ball, "Mart", "1970-01-02 01:00:00"),
+        CheckIn("Bob", Pokeball.poke_ball, "Mart", "1970-01-02 01:30:00"),
+    ]
+
+    names = [(a1.name, a2.name) for a1, a2 in timeline.rendezvous()]
+    assert names == [("Alice", "Bob")]